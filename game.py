@@ -5,6 +5,7 @@
 # Run: python game.py
 
 import pygame, os, random, json, sys, math
+from collections import deque
 from typing import Tuple
 
 # ---------------------------
@@ -36,6 +37,9 @@ PLAYER_SIZE = (96, 128)
 ENEMY_SIZE = (96, 128)
 BOX_SIZE = (64, 64)
 POTION_SIZE = (40, 40)
+# widest possible player/entity overlap in x (half widths summed, +2 for rect rounding);
+# anything further apart can't collide, so colliderect is skipped
+COLLIDE_DX = (PLAYER_SIZE[0] + max(ENEMY_SIZE[0], BOX_SIZE[0], POTION_SIZE[0])) // 2 + 2
 
 # Settings defaults
 DEFAULT_SETTINGS = {
@@ -84,6 +88,20 @@ def load_frames(prefix, count):
             frames.append(f)
     return frames
 
+def build_atlas(frames):
+    # pack equally sized frames side by side into one surface;
+    # returns (atlas, source rects), blit a frame with area=rects[i]
+    if not frames:
+        return None, []
+    w, h = frames[0].get_size()
+    atlas = pygame.Surface((w * len(frames), h), pygame.SRCALPHA).convert_alpha()
+    rects = []
+    for i, f in enumerate(frames):
+        # RGBA_MAX onto the cleared atlas copies pixels (alpha included) unblended
+        atlas.blit(f, (i * w, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        rects.append(pygame.Rect(i * w, 0, w, h))
+    return atlas, rects
+
 def load_json(path, default):
     try:
         with open(path, "r") as f:
@@ -99,19 +117,23 @@ def save_json(path, data):
         print("Failed to save", path, e)
 
 # ---------------------------
-# GLOBAL ASSETS (filled by load_all)
+# GLOBAL ASSETS (filled by load_menu_assets / load_game_assets)
 # ---------------------------
 player_run_frames = []
 player_idle_frames = []
 player_jump_frame = None
 player_dead_frame = None
+player_run_atlas, player_run_rects = None, []
+player_idle_atlas, player_idle_rects = None, []
 
 enemy_run_frames = []
 enemy_idle_frames = []
 enemy_attack_frames = []
 enemy_dead_frame = None
+enemy_run_atlas, enemy_run_rects = None, []
 
 bg_img = None
+bg_scaled = None   # bg_img scaled to screen height, built once in load_game_assets
 logo_img = None
 box_img = None
 potion_img = None
@@ -122,8 +144,16 @@ player_heal_sfx = None
 player_death_sfx = None
 enemy_attack_sfx = None
 
+# dedicated mixer channels for the hot-path sfx (filled by init_channels)
+hit_channel = None
+heal_channel = None
+jump_channel = None
+attack_channel = None
+
 music_path = asset_path("music.mp3")
 
+_game_assets_loaded = False   # load_game_assets runs once, on first Start Game
+
 # ---------------------------
 # Load settings & save
 # ---------------------------
@@ -143,14 +173,49 @@ def apply_volume_to_all(vol):
         except Exception:
             pass
 
+def init_channels():
+    # reserve channels 0-3 so Sound.play() never steals them
+    global hit_channel, heal_channel, jump_channel, attack_channel
+    try:
+        pygame.mixer.set_num_channels(8)
+        pygame.mixer.set_reserved(4)
+        hit_channel = pygame.mixer.Channel(0)
+        heal_channel = pygame.mixer.Channel(1)
+        jump_channel = pygame.mixer.Channel(2)
+        attack_channel = pygame.mixer.Channel(3)
+    except Exception:
+        pass
+
+def play_sfx(sound, channel):
+    # play on the dedicated channel; a new play restarts the sound instead of
+    # searching for (and eventually running out of) free channels
+    if not sound:
+        return
+    if channel is None:
+        sound.play()
+    else:
+        channel.play(sound)
+
 # ---------------------------
 # ASSET LOADER
 # ---------------------------
-def load_all():
+# both loaders run after display.set_mode: every scaled surface is converted to
+# the display format so blits take SDL's fast path
+def load_menu_assets():
+    # only what the menu shows, so it comes up without waiting on the sprites
+    global logo_img
+    logo_img = load_image("logo.png")  # optional; used in menu if present
+    if logo_img:
+        logo_img = pygame.transform.smoothscale(logo_img, (480, 160)).convert_alpha()
+
+def load_game_assets():
     global player_run_frames, player_idle_frames, player_jump_frame, player_dead_frame
     global enemy_run_frames, enemy_idle_frames, enemy_attack_frames, enemy_dead_frame
-    global bg_img, logo_img, box_img, potion_img
+    global player_run_atlas, player_run_rects, player_idle_atlas, player_idle_rects
+    global enemy_run_atlas, enemy_run_rects
+    global bg_img, bg_scaled, box_img, potion_img
     global player_jump_sfx, player_hit_sfx, player_heal_sfx, player_death_sfx, enemy_attack_sfx
+    global _game_assets_loaded
 
     print("Loading assets from:", ASSET_DIR)
     # player
@@ -159,13 +224,15 @@ def load_all():
     player_jump_frame = load_image("player_jump.png")
     player_dead_frame = load_image("player_dead.png")
     if player_run_frames:
-        player_run_frames = [pygame.transform.smoothscale(f, PLAYER_SIZE) for f in player_run_frames]
+        player_run_frames = [pygame.transform.smoothscale(f, PLAYER_SIZE).convert_alpha() for f in player_run_frames]
     if player_idle_frames:
-        player_idle_frames = [pygame.transform.smoothscale(f, PLAYER_SIZE) for f in player_idle_frames]
+        player_idle_frames = [pygame.transform.smoothscale(f, PLAYER_SIZE).convert_alpha() for f in player_idle_frames]
     if player_jump_frame:
-        player_jump_frame = pygame.transform.smoothscale(player_jump_frame, PLAYER_SIZE)
+        player_jump_frame = pygame.transform.smoothscale(player_jump_frame, PLAYER_SIZE).convert_alpha()
     if player_dead_frame:
-        player_dead_frame = pygame.transform.smoothscale(player_dead_frame, PLAYER_SIZE)
+        player_dead_frame = pygame.transform.smoothscale(player_dead_frame, PLAYER_SIZE).convert_alpha()
+    player_run_atlas, player_run_rects = build_atlas(player_run_frames)
+    player_idle_atlas, player_idle_rects = build_atlas(player_idle_frames)
 
     # enemy
     enemy_run_frames = load_frames("enemy_run", 4)
@@ -173,23 +240,28 @@ def load_all():
     enemy_attack_frames = load_frames("enemy_attack", 3)
     enemy_dead_frame = load_image("enemy_dead.png")
     if enemy_run_frames:
-        enemy_run_frames = [pygame.transform.smoothscale(f, ENEMY_SIZE) for f in enemy_run_frames]
+        enemy_run_frames = [pygame.transform.smoothscale(f, ENEMY_SIZE).convert_alpha() for f in enemy_run_frames]
     if enemy_idle_frames:
-        enemy_idle_frames = [pygame.transform.smoothscale(f, ENEMY_SIZE) for f in enemy_idle_frames]
+        enemy_idle_frames = [pygame.transform.smoothscale(f, ENEMY_SIZE).convert_alpha() for f in enemy_idle_frames]
     if enemy_attack_frames:
-        enemy_attack_frames = [pygame.transform.smoothscale(f, ENEMY_SIZE) for f in enemy_attack_frames]
+        enemy_attack_frames = [pygame.transform.smoothscale(f, ENEMY_SIZE).convert_alpha() for f in enemy_attack_frames]
     if enemy_dead_frame:
-        enemy_dead_frame = pygame.transform.smoothscale(enemy_dead_frame, ENEMY_SIZE)
+        enemy_dead_frame = pygame.transform.smoothscale(enemy_dead_frame, ENEMY_SIZE).convert_alpha()
+    enemy_run_atlas, enemy_run_rects = build_atlas(enemy_run_frames)
 
     # env
     bg_img = load_image("bg.png")
-    logo_img = load_image("logo.png")  # optional; used in menu if present
     box_img = load_image("box.png")
     potion_img = load_image("potion.png")
+    if bg_img:
+        # scale once here; draw_background only blits
+        scale = HEIGHT / bg_img.get_height()
+        draw_w = int(bg_img.get_width() * scale)
+        bg_scaled = pygame.transform.smoothscale(bg_img, (draw_w, HEIGHT)).convert()
     if box_img:
-        box_img = pygame.transform.smoothscale(box_img, BOX_SIZE)
+        box_img = pygame.transform.smoothscale(box_img, BOX_SIZE).convert_alpha()
     if potion_img:
-        potion_img = pygame.transform.smoothscale(potion_img, POTION_SIZE)
+        potion_img = pygame.transform.smoothscale(potion_img, POTION_SIZE).convert_alpha()
 
     # sounds
     player_jump_sfx = load_sound("player_jump.wav")
@@ -197,6 +269,7 @@ def load_all():
     player_heal_sfx = load_sound("player_heal.wav")
     player_death_sfx = load_sound("player_death.wav")
     enemy_attack_sfx = load_sound("enemy_attack.wav")
+    _game_assets_loaded = True
     print("Assets loaded. Use console logs for missing assets.")
 
 # ---------------------------
@@ -212,11 +285,18 @@ def clamp(v, a, b):
 # ENTITY BASE and classes
 # ---------------------------
 class Entity:
+    draw_y = GROUND_Y   # midbottom y on screen
+    killed = False      # set on pickup/hit; swept out by Game.update
+    kind = None         # "enemy" / "box" / "potion", used by collision dispatch
+    dynamic = False     # needs update() every frame; static entities are only placed on screen
     def __init__(self, world_x):
         self.world_x = world_x
-    def update(self, dt, game): pass
-    def draw(self, surf, camera_x): pass
-    def rect(self, camera_x): return pygame.Rect(0,0,0,0)
+        self.screen_rect = pygame.Rect(0,0,0,0)
+    def update(self, dt, game):
+        # screen rect cached once per frame, reused by collision and draw;
+        # self.area is the source rect of the current frame inside self.image
+        self.screen_rect.size = self.area.size
+        self.screen_rect.midbottom = (self.world_x - game.camera_x, self.draw_y)
 
 class Player:
     def __init__(self, world_x):
@@ -233,12 +313,16 @@ class Player:
         fallback = pygame.Surface((80,110), pygame.SRCALPHA)
         fallback.fill((220,120,120))
 
-        self.run_frames = player_run_frames or [fallback]
-        self.idle_frames = player_idle_frames or [fallback]
+        # animations are (atlas, source rects) pairs
+        self.run_anim = (player_run_atlas, player_run_rects) if player_run_atlas else (fallback, [fallback.get_rect()])
+        self.idle_anim = (player_idle_atlas, player_idle_rects) if player_idle_atlas else (fallback, [fallback.get_rect()])
         self.jump_frame = player_jump_frame or fallback
         self.dead_frame = player_dead_frame or fallback
+        self.jump_area = self.jump_frame.get_rect()
+        self.dead_area = self.dead_frame.get_rect()
 
-        self.image = self.idle_frames[0]
+        self.image, rects = self.idle_anim
+        self.area = rects[0]
 
     def on_ground(self):
         return self.y >= GROUND_Y
@@ -251,12 +335,11 @@ class Player:
             # small forward boost
             self.world_x += 10
             self.state = "jump"
-            if player_jump_sfx:
-                player_jump_sfx.play()
+            play_sfx(player_jump_sfx, jump_channel)
 
-    def apply_gravity(self, dt):
-        self.vel_y += GRAVITY * (dt/16.67)
-        self.y += self.vel_y * (dt/16.67)
+    def apply_gravity(self, step):
+        self.vel_y += GRAVITY * step
+        self.y += self.vel_y * step
         if self.y >= GROUND_Y:
             self.y = GROUND_Y
             self.vel_y = 0
@@ -273,16 +356,14 @@ class Player:
             self.frame = 0
             return
         self.health -= amt
-        if player_hit_sfx:
-            player_hit_sfx.play()
+        play_sfx(player_hit_sfx, hit_channel)
         if self.health <= 0:
             self.die()
 
     def heal(self, amt=1):
         if not self.alive: return
         self.health = min(PLAYER_MAX_HEALTH, self.health + amt)
-        if player_heal_sfx:
-            player_heal_sfx.play()
+        play_sfx(player_heal_sfx, heal_channel)
 
     def die(self):
         if not self.alive: return
@@ -294,46 +375,45 @@ class Player:
     def update_animation(self, dt):
         if self.state == "dead":
             self.image = self.dead_frame
+            self.area = self.dead_area
             return
         if self.state == "jump":
             self.image = self.jump_frame
+            self.area = self.jump_area
             return
-        anim = self.run_frames if self.state == "run" else self.idle_frames
+        atlas, rects = self.run_anim if self.state == "run" else self.idle_anim
         self.frame_timer += dt
         if self.frame_timer >= self.frame_speed:
             self.frame_timer = 0
-            self.frame = (self.frame + 1) % len(anim)
-        self.image = anim[self.frame]
+            self.frame = (self.frame + 1) % len(rects)
+        self.image = atlas
+        self.area = rects[self.frame]
 
     def update(self, dt, game):
-        self.apply_gravity(dt)
+        self.apply_gravity(game.step)
         if self.on_ground() and self.state not in ("dead","jump"):
             self.state = "run"
         self.update_animation(dt)
         # auto-run scaled by difficulty modifier
-        self.world_x += game.speed * (dt/16.67)
-
-    def draw(self, surf, camera_x):
-        screen_x = world_to_screen_x(self.world_x, camera_x)
-        if hasattr(self, "image") and self.image:
-            r = self.image.get_rect(midbottom=(screen_x, self.y))
-            surf.blit(self.image, r)
-        else:
-            pygame.draw.rect(surf, (255,100,100), (screen_x-20, self.y-60, 40, 60))
+        self.world_x += game.speed * game.step
 
     def rect(self, camera_x):
         screen_x = world_to_screen_x(self.world_x, camera_x)
         if hasattr(self, "image") and self.image:
-            return self.image.get_rect(midbottom=(screen_x, self.y))
+            r = pygame.Rect((0,0), self.area.size)
+            r.midbottom = (screen_x, self.y)
+            return r
         return pygame.Rect(screen_x-20, int(self.y-60), 40, 60)
 
 class Enemy(Entity):
+    kind = "enemy"
+    dynamic = True
     def __init__(self, world_x):
         super().__init__(world_x)
         fallback = pygame.Surface((80,110), pygame.SRCALPHA)
         fallback.fill((180,50,50))
-        self.frames = enemy_run_frames or [fallback]
-        self.image = self.frames[0]
+        self.image, self.frames = (enemy_run_atlas, enemy_run_rects) if enemy_run_atlas else (fallback, [fallback.get_rect()])
+        self.area = self.frames[0]
         self.frame = 0
         self.frame_timer = 0
         self.frame_speed = 140
@@ -344,7 +424,7 @@ class Enemy(Entity):
 
     def update(self, dt, game):
         # patrol
-        self.world_x += self.dir * self.speed * (dt/16.67)
+        self.world_x += self.dir * self.speed * game.step
         if self.world_x < self.left:
             self.world_x = self.left
             self.dir = 1
@@ -356,46 +436,29 @@ class Enemy(Entity):
         if self.frame_timer >= self.frame_speed:
             self.frame_timer = 0
             self.frame = (self.frame + 1) % len(self.frames)
-        self.image = self.frames[self.frame]
-
-    def draw(self, surf, camera_x):
-        screen_x = world_to_screen_x(self.world_x, camera_x)
-        r = self.image.get_rect(midbottom=(screen_x, GROUND_Y))
-        surf.blit(self.image, r)
-
-    def rect(self, camera_x):
-        screen_x = world_to_screen_x(self.world_x, camera_x)
-        return self.image.get_rect(midbottom=(screen_x, GROUND_Y))
+        self.area = self.frames[self.frame]
+        super().update(dt, game)
 
 class Box(Entity):
+    kind = "box"
     def __init__(self, world_x):
         super().__init__(world_x)
         self.image = box_img or pygame.Surface(BOX_SIZE)
         if box_img is None:
             self.image.fill((120,80,40))
-    def update(self, dt, game): pass
-    def draw(self, surf, camera_x):
-        screen_x = world_to_screen_x(self.world_x, camera_x)
-        r = self.image.get_rect(midbottom=(screen_x, GROUND_Y))
-        surf.blit(self.image, r)
-    def rect(self, camera_x):
-        screen_x = world_to_screen_x(self.world_x, camera_x)
-        return self.image.get_rect(midbottom=(screen_x, GROUND_Y))
+        self.area = self.image.get_rect()
+        self.screen_rect.size = self.area.size
 
 class Potion(Entity):
+    kind = "potion"
+    draw_y = GROUND_Y - 10
     def __init__(self, world_x):
         super().__init__(world_x)
         self.image = potion_img or pygame.Surface(POTION_SIZE)
         if potion_img is None:
             self.image.fill((80,200,120))
-    def update(self, dt, game): pass
-    def draw(self, surf, camera_x):
-        screen_x = world_to_screen_x(self.world_x, camera_x)
-        r = self.image.get_rect(midbottom=(screen_x, GROUND_Y-10))
-        surf.blit(self.image, r)
-    def rect(self, camera_x):
-        screen_x = world_to_screen_x(self.world_x, camera_x)
-        return self.image.get_rect(midbottom=(screen_x, GROUND_Y-10))
+        self.area = self.image.get_rect()
+        self.screen_rect.size = self.area.size
 
 # ---------------------------
 # GAME (camera, spawn, logic)
@@ -405,32 +468,58 @@ class Game:
         self.screen = screen
         self.clock = pygame.time.Clock()
         self.player = Player(100)
-        self.camera_x = 0.0
+        # kept as an int so draw math (background offset) stays integer
+        self.camera_x = 0
+        self._bg_scaled_w = bg_scaled.get_width() if bg_scaled else 0
         self.settings = settings_local
         # base speed multiplied by difficulty modifier
         self.base_speed = PLAYER_START_SPEED_BASE * DIFFICULTY_MOD.get(self.settings.get("difficulty","Normal"), 1.0)
         self.speed = self.base_speed
         self.score = 0
+        # frame time as a multiple of a 60fps frame, set each update
+        self.step = 1.0
         self.last_milestone = -1
-        self.entities = []
+        # kept in increasing world_x order (spawns append to the right), so
+        # passed entities are always pruned from the left
+        self.entities = deque()
+        # the subset that needs update() each frame (enemies), same ordering
+        self.dynamic_entities = deque()
+        # HUD fonts and static text, rendered once instead of every frame
+        self.hud_font = pygame.font.Font(None, 36)
+        self.big_font = pygame.font.Font(None, 64)
+        self.info_font = pygame.font.Font(None, 28)
+        self._gameover_surf = self.big_font.render("GAME OVER", True, (255,255,255))
+        self._restart_surf = self.info_font.render("Press R to Restart  ·  ESC to Quit", True, (230,230,230))
+        self._score_cache = (-1, None)   # (score, rendered surface)
+        self._heart_surf = pygame.Surface((22, 22), pygame.SRCALPHA)
+        self._heart_surf.fill((220,40,40))
         self._seed_initial_world()
         # adjust potion weight by difficulty (hard = fewer potions)
         self.potion_weight = POTION_BASE_WEIGHT * (1.0 if self.settings.get("difficulty","Normal")=="Normal" else (0.8 if self.settings.get("difficulty","Normal")=="Easy" else 0.6))
 
     def _seed_initial_world(self):
         x = 600
+        # spawn x of the right-most entity; entities are appended in
+        # increasing x and pruned from behind, so this never needs a rescan
+        self.furthest_x = self.player.world_x
         for i in range(5):
             t = random.choice(["box","enemy","potion"])
             if t=="box":
-                self.entities.append(Box(x))
+                self._add_entity(Box(x))
             elif t=="enemy":
-                self.entities.append(Enemy(x))
+                self._add_entity(Enemy(x))
             else:
-                self.entities.append(Potion(x))
+                self._add_entity(Potion(x))
             x += random.randint(300, 500)
 
+    def _add_entity(self, e):
+        self.entities.append(e)
+        if e.dynamic:
+            self.dynamic_entities.append(e)
+        self.furthest_x = e.world_x
+
     def spawn_if_needed(self):
-        furthest = max([e.world_x for e in self.entities] + [self.player.world_x])
+        furthest = max(self.furthest_x, self.player.world_x)
         while furthest < self.camera_x + WIDTH + MIN_SPAWN_DIST:
             x = furthest + random.randint(MIN_SPAWN_DIST, MAX_SPAWN_DIST)
             # probabilities, potions rarer, affected by difficulty param
@@ -439,48 +528,63 @@ class Game:
             if typ=="box": e = Box(x)
             elif typ=="enemy": e = Enemy(x)
             else: e = Potion(x)
-            self.entities.append(e)
+            self._add_entity(e)
             furthest = x
 
     def update(self, dt):
         if not self.player.alive:
             return
+        # shared by all movement this frame
+        self.step = dt/16.67
         # update player
         self.player.update(dt, self)
         # camera follow: keep player at 35% screen
-        self.camera_x = self.player.world_x - (WIDTH * 0.35)
-        # update entities
-        for e in list(self.entities):
-            e.update(dt, self)
+        self.camera_x = int(self.player.world_x - WIDTH * 0.35)
+        # only entities near the viewport are updated / collision tested;
+        # enemies patrol +-120 around their spawn so the 200px margin is safe
+        view_left = self.camera_x - 200
+        view_right = self.camera_x + WIDTH + 200
+        # update entities (boxes/potions have nothing to update)
+        for e in self.dynamic_entities:
+            if view_left <= e.world_x <= view_right:
+                e.update(dt, self)
         # collisions
-        p_rect = self.player.rect(self.camera_x)
-        for e in list(self.entities):
-            try:
-                if p_rect.colliderect(e.rect(self.camera_x)):
-                    if isinstance(e, Enemy):
-                        if self.player.health == 1:
-                            if enemy_attack_sfx:
-                                enemy_attack_sfx.play()
-                        self.player.take_damage()
-                        try: self.entities.remove(e)
-                        except: pass
-                    elif isinstance(e, Box):
-                        # box does not damage and does not disappear on touch
-                        pass
-                    elif isinstance(e, Potion):
-                        self.player.heal()
-                        try: self.entities.remove(e)
-                        except: pass
-            except Exception:
-                pass
-        # remove passed entities (score)
-        for e in list(self.entities):
-            if e.world_x < self.player.world_x - 220:
-                # grant score if player passed
-                if self.player.world_x > e.world_x:
-                    self.score += 1
-                try: self.entities.remove(e)
-                except: pass
+        p_rect = self.player.screen_rect = self.player.rect(self.camera_x)
+        px = self.player.world_x
+        cam = self.camera_x
+        for e in self.entities:
+            if e.killed or not (view_left <= e.world_x <= view_right):
+                continue
+            if not e.dynamic:
+                # static entities only need their screen rect moved with the camera
+                e.screen_rect.midbottom = (e.world_x - cam, e.draw_y)
+            # cheap world-space range test before the colliderect C call
+            dx = e.world_x - px
+            if dx < -COLLIDE_DX or dx > COLLIDE_DX:
+                continue
+            if p_rect.colliderect(e.screen_rect):
+                k = e.kind
+                if k == "enemy":
+                    if self.player.health == 1:
+                        play_sfx(enemy_attack_sfx, attack_channel)
+                    self.player.take_damage()
+                    e.killed = True
+                elif k == "box":
+                    # box does not damage and does not disappear on touch
+                    pass
+                elif k == "potion":
+                    self.player.heal()
+                    e.killed = True
+        # remove killed and passed entities (score) from the left
+        cutoff = self.player.world_x - 220
+        while self.entities and (self.entities[0].killed or self.entities[0].world_x < cutoff):
+            e = self.entities.popleft()
+            # grant score if player passed
+            if not e.killed and self.player.world_x > e.world_x:
+                self.score += 1
+        dyn = self.dynamic_entities
+        while dyn and (dyn[0].killed or dyn[0].world_x < cutoff):
+            dyn.popleft()
         # speed increase by score
         milestone = self.score // SCORE_STEP
         if milestone > self.last_milestone:
@@ -491,12 +595,9 @@ class Game:
         self.spawn_if_needed()
 
     def draw_background(self):
-        if bg_img:
-            bg_w = bg_img.get_width()
-            scale = HEIGHT / bg_img.get_height()
-            draw_w = int(bg_w * scale)
-            bg_scaled = pygame.transform.smoothscale(bg_img, (draw_w, HEIGHT))
-            offset = int(self.camera_x % draw_w)
+        if bg_scaled:
+            draw_w = self._bg_scaled_w
+            offset = self.camera_x % draw_w
             self.screen.blit(bg_scaled, (-offset, 0))
             # second tile
             if -offset + draw_w < WIDTH:
@@ -509,26 +610,28 @@ class Game:
         pygame.draw.rect(self.screen, (160,120,60), (0, GROUND_Y, WIDTH, GROUND_HEIGHT))
         # draw world objects (boxes, potions, enemies)
         # draw enemies last among objects to be under player? we'll draw all, then player on top
-        for e in self.entities:
-            e.draw(self.screen, self.camera_x)
+        # on-screen entities go out in a single blits() call instead of one blit per entity
+        # (screen rects were computed in update; everything drawn is inside the update band)
+        cam = self.camera_x
+        blit_list = [(e.image, e.screen_rect, e.area)
+                     for e in self.entities if not e.killed and -100 < e.world_x - cam < WIDTH + 100]
+        self.screen.blits(blit_list, doreturn=0)
         # player
-        self.player.draw(self.screen, self.camera_x)
+        self.screen.blit(self.player.image, self.player.screen_rect, self.player.area)
         # HUD
         self.draw_hud()
         pygame.display.flip()
 
     def draw_hud(self):
-        font = pygame.font.Font(None, 36)
-        s = font.render(f"Score: {self.score}", True, (255,255,255))
-        self.screen.blit(s, (WIDTH-160, 12))
+        if self._score_cache[0] != self.score:
+            self._score_cache = (self.score, self.hud_font.render(f"Score: {self.score}", True, (255,255,255)))
+        self.screen.blit(self._score_cache[1], (WIDTH-160, 12))
         for i in range(self.player.health):
-            pygame.draw.rect(self.screen, (220,40,40), (12 + i*30, 12, 22, 22))
+            self.screen.blit(self._heart_surf, (12 + i*30, 12))
         if not self.player.alive:
-            fbig = pygame.font.Font(None, 64)
-            t = fbig.render("GAME OVER", True, (255,255,255))
+            t = self._gameover_surf
             self.screen.blit(t, (WIDTH//2 - t.get_width()//2, HEIGHT//2 - 80))
-            finfo = pygame.font.Font(None, 28)
-            rtxt = finfo.render("Press R to Restart  ·  ESC to Quit", True, (230,230,230))
+            rtxt = self._restart_surf
             self.screen.blit(rtxt, (WIDTH//2 - rtxt.get_width()//2, HEIGHT//2 + 4))
 
 # ---------------------------
@@ -543,11 +646,12 @@ class Button:
         self.hover = hover
         self.text_color = text_color
         self.hovered = False
+        self.text_s = font.render(text, True, text_color)   # label never changes
 
     def draw(self, surf):
         color = self.hover if self.hovered else self.base
         pygame.draw.rect(surf, color, self.rect, border_radius=8)
-        text_s = self.font.render(self.text, True, self.text_color)
+        text_s = self.text_s
         surf.blit(text_s, (self.rect.centerx - text_s.get_width()//2, self.rect.centery - text_s.get_height()//2))
 
     def update_hover(self, mx, my):
@@ -563,6 +667,7 @@ class App:
     def __init__(self):
         pygame.init()
         pygame.mixer.init()
+        init_channels()
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption(APP_TITLE)
         # icon
@@ -572,7 +677,8 @@ class App:
             except Exception:
                 pass
         # load assets & settings
-        load_all()
+        # game sprites/sounds are deferred to the first start_game
+        load_menu_assets()
         apply_volume_to_all(settings.get("volume", DEFAULT_SETTINGS["volume"]))
         # start music if present
         try:
@@ -593,11 +699,30 @@ class App:
         self.btn_start = Button(pygame.Rect(cx, 220, btn_w, btn_h), "Start Game", self.font_med)
         self.btn_settings = Button(pygame.Rect(cx, 300, btn_w, btn_h), "Settings", self.font_med)
         self.btn_quit = Button(pygame.Rect(cx, 380, btn_w, btn_h), "Quit", self.font_med)
+        # settings screen layout, shared by draw_settings and handle_settings_click
+        self._slider_rect = pygame.Rect(320, 150, 420, 36)
+        self._diff_rects = [(d, pygame.Rect(320 + i*160, 240, 140, 42)) for i, d in enumerate(["Easy", "Normal", "Hard"])]
+        self._back_rect = pygame.Rect(WIDTH//2 - 72, HEIGHT - 100, 144, 44)
+        # static menu/settings text rendered once; high score and volume % are
+        # cached as (value, surface) and re-rendered only when the value changes
+        self._title_surf = self.font_large.render(APP_TITLE, True, (230,230,230))
+        self._inst_surf = self.font_small.render("Space = Jump · R = Restart · Esc = Quit/Game Over", True, (130,130,130))
+        self._settings_title_surf = self.font_large.render("Settings", True, (240,240,240))
+        self._volume_label_surf = self.font_med.render("Volume", True, (220,220,220))
+        self._diff_label_surf = self.font_med.render("Difficulty", True, (220,220,220))
+        self._diff_txt = {d: self.font_small.render(d, True, (255,255,255)) for d, _ in self._diff_rects}
+        self._back_surf = self.font_small.render("Back (Esc)", True, (255,255,255))
+        self._footer_surf = self.font_small.render("Toggle volume by dragging slider. Click difficulty. Press Esc to save & back.", True, (160,160,160))
+        self._hs_cache = (None, None)
+        self._vol_cache = (None, None)
         # settings UI elements (simple sliders)
         self.volume = settings.get("volume", DEFAULT_SETTINGS["volume"])
         self.difficulty = settings.get("difficulty", DEFAULT_SETTINGS["difficulty"])
+        self._last_volume = self.volume   # volume last pushed to the mixer
+        self._settings_dirty = False      # settings changed since last write
         # persistent high score
         self.high_score = save_data.get("high_score", 0)
+        self._saved_high_score = self.high_score   # value currently on disk
         # state
         self.state = "menu"  # menu, settings, playing
         self.game = None
@@ -625,8 +750,8 @@ class App:
                         elif self.btn_quit.is_clicked(mx,my):
                             running = False
                     elif self.state == "settings":
-                        # click regions for sliders/buttons handled in draw step via mouse pos check
-                        pass
+                        # one-shot clicks (difficulty, back); slider dragging is polled in draw_settings
+                        self.handle_settings_click(mx,my)
                 elif ev.type == pygame.KEYDOWN:
                     if self.state == "playing":
                         if ev.key in (pygame.K_SPACE, pygame.K_w, pygame.K_UP):
@@ -651,20 +776,33 @@ class App:
                 self.update_game(dt)
                 self.draw_game()
         # exit save settings and high score
-        save_json(SETTINGS_FILE, {"volume": self.volume, "difficulty": self.difficulty})
-        save_json(SAVE_FILE, {"high_score": self.high_score})
+        self.save_settings()
+        self.save_high_score()
         pygame.quit()
         sys.exit()
 
     # -------------------------
     # Menu/Settings/Game control
     # -------------------------
-    def start_game(self):
-        # apply settings to sound volume
+    def save_settings(self):
+        # sync the shared settings dict; only touch the disk if something changed
         settings["volume"] = self.volume
         settings["difficulty"] = self.difficulty
+        if self._settings_dirty:
+            save_json(SETTINGS_FILE, settings)
+            self._settings_dirty = False
+
+    def save_high_score(self):
+        if self.high_score > self._saved_high_score:
+            save_json(SAVE_FILE, {"high_score": self.high_score})
+            self._saved_high_score = self.high_score
+
+    def start_game(self):
+        if not _game_assets_loaded:
+            load_game_assets()
+        # apply settings to sound volume
+        self.save_settings()
         apply_volume_to_all(self.volume)
-        save_json(SETTINGS_FILE, settings)
         # create Game instance
         self.game = Game(self.screen, settings)
         # sync speed base to difficulty modifier immediate
@@ -676,17 +814,10 @@ class App:
         if self.game:
             if self.game.score > self.high_score:
                 self.high_score = self.game.score
-                save_json(SAVE_FILE, {"high_score": self.high_score})
+            self.save_high_score()
         self.game = None
         self.state = "menu"
 
-    def save_settings_and_back(self):
-        settings["volume"] = self.volume
-        settings["difficulty"] = self.difficulty
-        save_json(SETTINGS_FILE, settings)
-        apply_volume_to_all(self.volume)
-        self.state = "menu"
-
     # -------------------------
     # Drawing: Menu / Settings
     # -------------------------
@@ -694,33 +825,31 @@ class App:
         self.screen.fill((18,18,18))
         # optionally draw logo
         if logo_img:
-            logo_s = pygame.transform.smoothscale(logo_img, (480, 160))
-            self.screen.blit(logo_s, (WIDTH//2 - logo_s.get_width()//2, 40))
+            self.screen.blit(logo_img, (WIDTH//2 - logo_img.get_width()//2, 40))
         else:
-            title = self.font_large.render(APP_TITLE, True, (230,230,230))
+            title = self._title_surf
             self.screen.blit(title, (WIDTH//2 - title.get_width()//2, 60))
         # draw buttons
         self.btn_start.draw(self.screen)
         self.btn_settings.draw(self.screen)
         self.btn_quit.draw(self.screen)
         # high score
-        hs = self.font_small.render(f"High Score: {self.high_score}", True, (200,200,200))
-        self.screen.blit(hs, (20, HEIGHT-40))
+        if self._hs_cache[0] != self.high_score:
+            self._hs_cache = (self.high_score, self.font_small.render(f"High Score: {self.high_score}", True, (200,200,200)))
+        self.screen.blit(self._hs_cache[1], (20, HEIGHT-40))
         # instructions small
-        inst = self.font_small.render("Space = Jump · R = Restart · Esc = Quit/Game Over", True, (130,130,130))
-        self.screen.blit(inst, (20, HEIGHT-20))
+        self.screen.blit(self._inst_surf, (20, HEIGHT-20))
         pygame.display.flip()
 
     def draw_settings(self):
         self.screen.fill((24,24,30))
         # title
-        t = self.font_large.render("Settings", True, (240,240,240))
+        t = self._settings_title_surf
         self.screen.blit(t, (WIDTH//2 - t.get_width()//2, 30))
         # Volume slider
-        label = self.font_med.render("Volume", True, (220,220,220))
-        self.screen.blit(label, (180, 150))
+        self.screen.blit(self._volume_label_surf, (180, 150))
         # slider background rect
-        slider_rect = pygame.Rect(320, 150, 420, 36)
+        slider_rect = self._slider_rect
         pygame.draw.rect(self.screen, (60,60,60), slider_rect, border_radius=8)
         # slider fill
         fill_w = int(self.volume * slider_rect.width)
@@ -729,59 +858,55 @@ class App:
         handle_x = slider_rect.x + fill_w
         pygame.draw.circle(self.screen, (240,240,240), (handle_x, slider_rect.centery), 10)
         # slider text
-        vol_text = self.font_small.render(f"{int(self.volume*100)}%", True, (220,220,220))
-        self.screen.blit(vol_text, (slider_rect.x + slider_rect.width + 12, slider_rect.y))
+        pct = int(self.volume*100)
+        if self._vol_cache[0] != pct:
+            self._vol_cache = (pct, self.font_small.render(f"{pct}%", True, (220,220,220)))
+        self.screen.blit(self._vol_cache[1], (slider_rect.x + slider_rect.width + 12, slider_rect.y))
 
         # Difficulty options
-        dlabel = self.font_med.render("Difficulty", True, (220,220,220))
-        self.screen.blit(dlabel, (180, 240))
+        self.screen.blit(self._diff_label_surf, (180, 240))
         # difficulty buttons
-        diffs = ["Easy", "Normal", "Hard"]
-        bx = 320
-        by = 240
-        for d in diffs:
-            r = pygame.Rect(bx, by, 140, 42)
+        for d, r in self._diff_rects:
             color = (80,120,200) if self.difficulty == d else (60,60,60)
             pygame.draw.rect(self.screen, color, r, border_radius=8)
-            txt = self.font_small.render(d, True, (255,255,255))
+            txt = self._diff_txt[d]
             self.screen.blit(txt, (r.centerx - txt.get_width()//2, r.centery - txt.get_height()//2))
-            bx += 160
 
         # Back button
-        back_rect = pygame.Rect(WIDTH//2 - 72, HEIGHT - 100, 144, 44)
+        back_rect = self._back_rect
         pygame.draw.rect(self.screen, (140,60,60), back_rect, border_radius=8)
-        back_txt = self.font_small.render("Back (Esc)", True, (255,255,255))
+        back_txt = self._back_surf
         self.screen.blit(back_txt, (back_rect.centerx - back_txt.get_width()//2, back_rect.centery - back_txt.get_height()//2))
 
-        # Interactions: mouse-based slider and clicks
-        mx, my = pygame.mouse.get_pos()
+        # Interactions: slider is dragged while the button is held
+        # (difficulty / back clicks come from MOUSEBUTTONDOWN, see handle_settings_click)
         mb = pygame.mouse.get_pressed()
         if mb[0]:
+            mx, my = pygame.mouse.get_pos()
             # if clicked on slider area adjust volume
             if slider_rect.collidepoint(mx,my):
-                rel = clamp((mx - slider_rect.x) / slider_rect.width, 0.0, 1.0)
-                self.volume = rel
-                apply_volume_to_all(self.volume)
-        # check difficulty clicks
-        bx = 320
-        for d in diffs:
-            r = pygame.Rect(bx, by, 140, 42)
-            if pygame.mouse.get_pressed()[0] and r.collidepoint(mx,my):
-                self.difficulty = d
-            bx += 160
-        # check back click
-        if pygame.mouse.get_pressed()[0] and back_rect.collidepoint(mx,my):
-            self.save_settings_and_back()
+                self.volume = clamp((mx - slider_rect.x) / slider_rect.width, 0.0, 1.0)
+                if self.volume != self._last_volume:
+                    apply_volume_to_all(self.volume)
+                    self._last_volume = self.volume
+                    self._settings_dirty = True
 
         # footer
-        footer = self.font_small.render("Toggle volume by dragging slider. Click difficulty. Press Esc to save & back.", True, (160,160,160))
-        self.screen.blit(footer, (40, HEIGHT-40))
+        self.screen.blit(self._footer_surf, (40, HEIGHT-40))
         pygame.display.flip()
 
+    def handle_settings_click(self, mx, my):
+        # difficulty clicks
+        for d, r in self._diff_rects:
+            if r.collidepoint(mx,my) and self.difficulty != d:
+                self.difficulty = d
+                self._settings_dirty = True
+        # back click
+        if self._back_rect.collidepoint(mx,my):
+            self.save_settings_and_back()
+
     def save_settings_and_back(self):
-        settings["volume"] = self.volume
-        settings["difficulty"] = self.difficulty
-        save_json(SETTINGS_FILE, settings)
+        self.save_settings()
         apply_volume_to_all(self.volume)
         self.state = "menu"
 
@@ -797,7 +922,7 @@ class App:
         if not self.game.player.alive:
             if self.game.score > self.high_score:
                 self.high_score = self.game.score
-                save_json(SAVE_FILE, {"high_score": self.high_score})
+                self.save_high_score()
 
     def draw_game(self):
         if not self.game: